@@ -12,9 +12,6 @@ from ...ast import add_methods
 from ...ast import add_modules
 from ...ast.globals import Globals
 from ..node.abstract.node import AbstractNodeClient
-from .store import CryptoStore
-
-from .protocol import beaver  # noqa: 401 isort: skip
 
 
 def create_smpc_ast(client: Optional[AbstractNodeClient] = None) -> Globals:
@@ -27,6 +24,13 @@ def create_smpc_ast(client: Optional[AbstractNodeClient] = None) -> Globals:
     Returns:
         The constructed SMPC AST.
     """
+    # deferred so that importing syft.core.smpc does not pull in the whole
+    # SMPC stack; the cost is paid only when the AST is actually built
+    # relative
+    from .store import CryptoStore
+
+    from .protocol import beaver  # noqa: 401 isort: skip
+
     ast = Globals(client)
 
     modules = [
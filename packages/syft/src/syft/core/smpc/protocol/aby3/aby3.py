@@ -3,11 +3,15 @@
 ABY3 : A Mixed Protocol Framework for Machine Learning.
 https://eprint.iacr.org/2018/403.pdf
 """
+# future
+from __future__ import annotations
+
 # stdlib
 from functools import reduce
 import secrets
 from typing import Any
 from typing import List
+from typing import TYPE_CHECKING
 from typing import Union
 from uuid import UUID
 
@@ -19,11 +23,14 @@ from tqdm import tqdm
 from .....ast.klass import get_run_class_method
 from ....common import UID
 from ....tensor.config import DEFAULT_RING_SIZE
-from ....tensor.smpc.mpc_tensor import MPCTensor
 from ....tensor.smpc.share_tensor import ShareTensor
 from ....tensor.smpc.utils import get_nr_bits
 from ...store.crypto_primitive_provider import CryptoPrimitiveProvider
 
+if TYPE_CHECKING:
+    # relative
+    from ....tensor.smpc.mpc_tensor import MPCTensor
+
 
 class ABY3:
     """ABY3 Protocol Implementation."""
@@ -59,6 +66,7 @@ class ABY3:
         """
         # relative
         from ....tensor import TensorPointer
+        from ....tensor.smpc.mpc_tensor import MPCTensor
 
         shape = x.shape
         parties = x.parties
@@ -227,6 +235,7 @@ class ABY3:
         """
         # relative
         from ....tensor import TensorPointer
+        from ....tensor.smpc.mpc_tensor import MPCTensor
 
         nr_parties = len(x.parties)
         ring_size = DEFAULT_RING_SIZE
@@ -20,7 +20,6 @@ import numpy as np
 
 # relative
 from ....tensor.config import DEFAULT_RING_SIZE
-from ....tensor.smpc.mpc_tensor import MPCTensor
 from ....tensor.smpc.share_tensor import ShareTensor
 from ....tensor.smpc.utils import RING_SIZE_TO_TYPE
 from ....tensor.smpc.utils import count_wraps
@@ -70,6 +69,7 @@ def _get_triples(
     """
     # relative
     from ..... import Tensor
+    from ....tensor.smpc.mpc_tensor import MPCTensor
 
     numpy_type = RING_SIZE_TO_TYPE[ring_size]
     cmd = ShareTensor.get_op(ring_size, op_str)
@@ -361,6 +361,7 @@ def count_wraps_rand(
     """
     # relative
     from ..... import Tensor
+    from ....tensor.smpc.mpc_tensor import MPCTensor
 
     numpy_type = RING_SIZE_TO_TYPE[ring_size]
     min_value, max_value = ShareTensor.compute_min_max_from_ring(ring_size)
@@ -1467,6 +1467,67 @@ class PhiTensor(PassthroughTensor, ADPTensor):
             max_vals=max_vals,
         )
 
+    def clip(self, a_min: float, a_max: float) -> PhiTensor:
+        """Clip (limit) the values in the tensor between a_min and a_max."""
+        output_data = np.clip(self.child, a_min, a_max)
+
+        min_vals = lazyrepeatarray(
+            data=np.clip(self.min_vals.data, a_min, a_max), shape=output_data.shape
+        )
+        max_vals = lazyrepeatarray(
+            data=np.clip(self.max_vals.data, a_min, a_max), shape=output_data.shape
+        )
+
+        return PhiTensor(
+            child=output_data,
+            data_subjects=self.data_subjects,
+            min_vals=min_vals,
+            max_vals=max_vals,
+        )
+
+    def reshape(self, *shape: Any) -> PhiTensor:
+        """Gives a new shape to the tensor without changing its data."""
+        data = self.child.reshape(*shape)
+
+        min_data = self.min_vals.data
+        max_data = self.max_vals.data
+        if min_data.size == data.size:
+            min_data = min_data.reshape(data.shape)
+            max_data = max_data.reshape(data.shape)
+        else:
+            # collapse broadcast bounds to conservative scalars
+            min_data = min_data.min()
+            max_data = max_data.max()
+
+        return PhiTensor(
+            child=data,
+            data_subjects=self.data_subjects,
+            min_vals=lazyrepeatarray(data=min_data, shape=data.shape),
+            max_vals=lazyrepeatarray(data=max_data, shape=data.shape),
+        )
+
+    def take(
+        self, indices: Union[Sequence, np.ndarray], axis: int = 0
+    ) -> PhiTensor:
+        """Take elements from the tensor along an axis, e.g. for mini-batch sampling."""
+        data = self.child.take(indices, axis=axis)
+
+        data_subjects = self.data_subjects
+        dsi = data_subjects.data_subjects_indexed
+        if dsi.ndim > axis and dsi.shape[axis] == self.child.shape[axis]:
+            # data subjects are tracked along this axis, so gather them as well
+            data_subjects = DataSubjectList(
+                one_hot_lookup=data_subjects.one_hot_lookup,
+                data_subjects_indexed=dsi.take(indices, axis=axis),
+            )
+
+        return PhiTensor(
+            child=data,
+            data_subjects=data_subjects,
+            min_vals=lazyrepeatarray(data=self.min_vals.data.min(), shape=data.shape),
+            max_vals=lazyrepeatarray(data=self.max_vals.data.max(), shape=data.shape),
+        )
+
     def concatenate(
         self,
         other: Union[np.ndarray, PhiTensor],
@@ -0,0 +1,20 @@
+# relative
+from .layers.base import Layer
+from .layers.linear import Linear
+from .layers.reshape import Flatten
+from .loss import BinaryCrossEntropy
+from .loss import Loss
+from .model import Model
+from .optimizers import Adamax
+from .optimizers import Optimizer
+
+__all__ = [
+    "Layer",
+    "Linear",
+    "Flatten",
+    "Loss",
+    "BinaryCrossEntropy",
+    "Model",
+    "Optimizer",
+    "Adamax",
+]
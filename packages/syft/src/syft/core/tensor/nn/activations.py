@@ -0,0 +1,91 @@
+# future
+from __future__ import annotations
+
+# stdlib
+from typing import Optional
+from typing import Union
+
+# third party
+import numpy as np
+
+# relative
+from ..autodp.phi_tensor import PhiTensor
+from ..lazy_repeat_array import lazyrepeatarray
+
+
+class Activation:
+    """Base class for activation functions used by nn layers."""
+
+    def __init__(self) -> None:
+        self.last_forward: Optional[PhiTensor] = None
+
+    def forward(self, input: PhiTensor) -> PhiTensor:
+        """Forward pass; subclasses must remember ``input`` if their
+        derivative needs it."""
+        raise NotImplementedError
+
+    def derivative(self, input: Optional[PhiTensor] = None) -> np.ndarray:
+        """Derivative w.r.t. the activation input, as a public ndarray."""
+        raise NotImplementedError
+
+
+class leaky_ReLU(Activation):
+    def __init__(self, slope: float = 0.01) -> None:
+        super().__init__()
+        self.slope = slope
+
+    def forward(self, input: PhiTensor) -> PhiTensor:
+        self.last_forward = input
+        data = input.child
+        output = np.where(data > 0, data, data * self.slope)
+
+        min_data = np.minimum(input.min_vals.data, input.min_vals.data * self.slope)
+        max_data = np.maximum(input.max_vals.data, input.max_vals.data * self.slope)
+
+        return PhiTensor(
+            child=output,
+            data_subjects=input.data_subjects,
+            min_vals=lazyrepeatarray(data=min_data, shape=output.shape),
+            max_vals=lazyrepeatarray(data=max_data, shape=output.shape),
+        )
+
+    def derivative(self, input: Optional[PhiTensor] = None) -> np.ndarray:
+        last_forward = input if input is not None else self.last_forward
+        data = last_forward.child
+        return np.where(data > 0, 1.0, self.slope)
+
+
+class Sigmoid(Activation):
+    def forward(self, input: PhiTensor) -> PhiTensor:
+        self.last_forward = input
+        output = 1.0 / (1.0 + np.exp(-input.child))
+
+        # sigmoid is monotonic so bounds map through directly
+        min_data = 1.0 / (1.0 + np.exp(-input.min_vals.data))
+        max_data = 1.0 / (1.0 + np.exp(-input.max_vals.data))
+
+        return PhiTensor(
+            child=output,
+            data_subjects=input.data_subjects,
+            min_vals=lazyrepeatarray(data=min_data, shape=output.shape),
+            max_vals=lazyrepeatarray(data=max_data, shape=output.shape),
+        )
+
+    def derivative(self, input: Optional[PhiTensor] = None) -> np.ndarray:
+        last_forward = input if input is not None else self.last_forward
+        sigmoid = 1.0 / (1.0 + np.exp(-last_forward.child))
+        return sigmoid * (1.0 - sigmoid)
+
+
+def get(activation: Union[Activation, str, None]) -> Optional[Activation]:
+    """Resolve an activation given by name or instance."""
+    if activation is None or isinstance(activation, Activation):
+        return activation
+    if isinstance(activation, str):
+        activations = {
+            "leaky_relu": leaky_ReLU,
+            "sigmoid": Sigmoid,
+        }
+        if activation in activations:
+            return activations[activation]()
+    raise ValueError(f"Could not interpret activation identifier: {activation}")
@@ -0,0 +1,52 @@
+# future
+from __future__ import annotations
+
+# stdlib
+from typing import Tuple
+from typing import Union
+
+# third party
+import numpy as np
+
+
+def get_fans(shape: Tuple[int, ...]) -> Tuple[int, int]:
+    fan_in = shape[0] if len(shape) == 2 else int(np.prod(shape[1:]))
+    fan_out = shape[1] if len(shape) == 2 else shape[0]
+    return fan_in, fan_out
+
+
+class Initialization:
+    """Base class for weight initialization strategies."""
+
+    def __call__(self, size: Tuple[int, ...]) -> np.ndarray:
+        raise NotImplementedError
+
+
+class XavierInitialization(Initialization):
+    """Glorot & Bengio (2010) uniform initialization."""
+
+    def __call__(self, size: Tuple[int, ...]) -> np.ndarray:
+        fan_in, fan_out = get_fans(size)
+        scale = np.sqrt(6.0 / (fan_in + fan_out))
+        return np.random.uniform(-scale, scale, size=size)
+
+
+class Zero(Initialization):
+    def __call__(self, size: Tuple[int, ...]) -> np.ndarray:
+        return np.zeros(size)
+
+
+def get(initialization: Union[Initialization, str]) -> Initialization:
+    """Resolve an initialization given by name or instance."""
+    if isinstance(initialization, Initialization):
+        return initialization
+    if isinstance(initialization, str):
+        initializations = {
+            "xavier_uniform": XavierInitialization,
+            "zero": Zero,
+        }
+        if initialization in initializations:
+            return initializations[initialization]()
+    raise ValueError(
+        f"Could not interpret initialization identifier: {initialization}"
+    )
@@ -0,0 +1,6 @@
+# relative
+from .base import Layer
+from .linear import Linear
+from .reshape import Flatten
+
+__all__ = ["Layer", "Linear", "Flatten"]
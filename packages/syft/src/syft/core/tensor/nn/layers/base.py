@@ -0,0 +1,63 @@
+# future
+from __future__ import annotations
+
+# stdlib
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# third party
+import numpy as np
+
+# relative
+from ...autodp.phi_tensor import PhiTensor
+
+
+class Layer:
+    """Base class for neural network layers.
+
+    Subclasses implement ``connect_to``, ``forward`` and ``backward`` and,
+    when they hold trainable weights, expose them through ``params``/``grads``
+    so that optimizers can update them in place.
+
+    Both ``params`` and ``grads`` must return the same ndarrays on every
+    call: the arrays are allocated once in ``connect_to`` and only ever
+    mutated in place (``backward`` writes gradients into the preallocated
+    buffers, optimizers write updated weights back into the parameter
+    arrays), so callers may cache the lists.
+    """
+
+    first_layer = False
+    # filled in by connect_to; the leading (batch) axis is None when unknown
+    out_shape: Tuple = ()
+
+    def connect_to(self, prev_layer: Optional[Layer] = None) -> None:
+        """Propagate shape information from the previous layer and
+        allocate any weights."""
+        raise NotImplementedError
+
+    def forward(self, input: PhiTensor) -> PhiTensor:
+        raise NotImplementedError
+
+    def backward(self, pre_grad: PhiTensor) -> Optional[PhiTensor]:
+        raise NotImplementedError
+
+    @property
+    def params(self) -> List[np.ndarray]:
+        """Trainable parameters, as a flat list of ndarrays."""
+        return []
+
+    @property
+    def grads(self) -> List[np.ndarray]:
+        """Gradients matching ``params`` one-to-one.
+
+        Every gradient is a sum over the batch rows (never a mean), so
+        gradients computed on disjoint row subsets of a batch add up to the
+        full-batch gradient; the synchronous and microbatched training paths
+        in ``Model.fit`` depend on this.
+        """
+        return []
+
+    def detach_grads(self) -> None:
+        """Reallocate the gradient buffers so a shallow-copied replica stops
+        sharing them with the original; the weight arrays stay shared."""
@@ -0,0 +1,90 @@
+# future
+from __future__ import annotations
+
+# stdlib
+from typing import List
+from typing import Optional
+from typing import Union
+
+# third party
+import numpy as np
+
+# relative
+from ...autodp.phi_tensor import PhiTensor
+from .. import activations
+from .. import initializations
+from ..activations import Activation
+from .base import Layer
+
+
+class Linear(Layer):
+    """A fully connected layer: ``output = activation(input @ W + b)``."""
+
+    def __init__(
+        self,
+        n_out: int,
+        n_in: Optional[int] = None,
+        init: Union[str, initializations.Initialization] = "xavier_uniform",
+        activation: Union[str, Activation, None] = None,
+    ) -> None:
+        self.n_out = n_out
+        self.n_in = n_in
+        self.init = initializations.get(init)
+        self.activation = activations.get(activation)
+
+        # reallocated with their real shapes in connect_to
+        self.W = np.zeros(0)
+        self.b = np.zeros(0)
+        self.dW = np.zeros(0)
+        self.db = np.zeros(0)
+        self.last_input: Optional[PhiTensor] = None
+
+    def connect_to(self, prev_layer: Optional[Layer] = None) -> None:
+        if prev_layer is None:
+            if self.n_in is None:
+                raise ValueError("n_in must be provided for the first layer.")
+            n_in = self.n_in
+        else:
+            n_in = prev_layer.out_shape[-1]
+
+        self.W = self.init((n_in, self.n_out))
+        self.b = np.zeros((self.n_out,))
+        self.dW = np.zeros_like(self.W)
+        self.db = np.zeros_like(self.b)
+        self.out_shape = (None, self.n_out)
+
+    def forward(self, input: PhiTensor) -> PhiTensor:
+        self.last_input = input
+        output = input @ self.W + self.b
+        if self.activation is not None:
+            output = self.activation.forward(output)
+        return output
+
+    def backward(self, pre_grad: PhiTensor) -> Optional[PhiTensor]:
+        if self.last_input is None:
+            raise RuntimeError("backward called before forward.")
+        if self.activation is not None:
+            pre_grad = pre_grad * self.activation.derivative()
+
+        # written straight into the buffers allocated in connect_to, so the
+        # arrays returned by .grads keep a stable identity across batches.
+        # both gradients are sums over the batch rows, so gradients computed
+        # on disjoint row subsets add up exactly to the full-batch gradient
+        # (grad_sync and microbatching in Model.fit rely on this)
+        np.matmul(self.last_input.child.T, pre_grad.child, out=self.dW)
+        np.sum(pre_grad.child, axis=0, out=self.db)
+        if not self.first_layer:
+            return pre_grad @ self.W.T
+        return None
+
+    @property
+    def params(self) -> List[np.ndarray]:
+        return [self.W, self.b]
+
+    @property
+    def grads(self) -> List[np.ndarray]:
+        return [self.dW, self.db]
+
+    def detach_grads(self) -> None:
+        self.dW = np.zeros_like(self.dW)
+        self.db = np.zeros_like(self.db)
@@ -0,0 +1,71 @@
+# future
+from __future__ import annotations
+
+# stdlib
+from math import prod
+from typing import Optional
+from typing import Tuple
+
+# relative
+from ...autodp.phi_tensor import PhiTensor
+from ...lazy_repeat_array import lazyrepeatarray
+from .base import Layer
+
+
+class Flatten(Layer):
+    """Flatten everything after the first ``outdim - 1`` axes into one axis,
+    e.g. to connect convolutional output to a fully connected layer."""
+
+    def __init__(self, outdim: int = 2, input_shape: Optional[Tuple] = None) -> None:
+        if outdim < 1:
+            raise ValueError("Dim must be > 0, but got " + str(outdim))
+        self.outdim = outdim
+        self.input_shape = input_shape
+        self.last_input_shape: Optional[Tuple] = None
+        self._fwd_shape: Optional[Tuple] = None
+
+    def connect_to(self, prev_layer: Optional[Layer] = None) -> None:
+        if prev_layer is None:
+            if self.input_shape is None:
+                raise ValueError("input_shape must be provided for the first layer.")
+            in_shape = self.input_shape
+        else:
+            in_shape = prev_layer.out_shape
+
+        # the layer topology is fixed once connected, so the target shape is
+        # computed once here (with math.prod on the plain tuple) rather than
+        # re-derived with NumPy on every forward call
+        to_flatten = prod(in_shape[self.outdim - 1 :])  # noqa: E203
+        prefix = in_shape[: self.outdim - 1]
+        self.out_shape = prefix + (to_flatten,)
+        # the leading (batch) axis is unknown until runtime, so let reshape
+        # infer it; the remaining leading axes are fixed by the topology
+        self._fwd_shape = (-1,) + prefix[1:] + (to_flatten,)
+
+    def forward(self, input: PhiTensor) -> PhiTensor:
+        self.last_input_shape = input.shape
+
+        child = input.child
+        min_data = input.min_vals.data
+        max_data = input.max_vals.data
+        if child.flags["C_CONTIGUOUS"] and min_data.size == child.size:
+            # merging trailing axes of a contiguous array is a pure view, so
+            # build the output tensor directly from reshaped views of the
+            # data and its bounds instead of going through the general
+            # PhiTensor.reshape path
+            data = child.reshape(self._fwd_shape)
+            return PhiTensor(
+                child=data,
+                data_subjects=input.data_subjects,
+                min_vals=lazyrepeatarray(
+                    data=min_data.reshape(data.shape), shape=data.shape
+                ),
+                max_vals=lazyrepeatarray(
+                    data=max_data.reshape(data.shape), shape=data.shape
+                ),
+            )
+
+        return input.reshape(self._fwd_shape)
+
+    def backward(self, pre_grad: PhiTensor) -> PhiTensor:
+        return pre_grad.reshape(self.last_input_shape)
@@ -0,0 +1,241 @@
+# future
+from __future__ import annotations
+
+# stdlib
+from typing import Tuple
+from typing import Union
+
+# third party
+import numpy as np
+
+try:
+    # third party
+    import numexpr
+except ImportError:  # pragma: no cover
+    numexpr = None  # type: ignore
+
+try:
+    # third party
+    from numba import njit
+    from numba import prange
+except ImportError:  # pragma: no cover
+    njit = None
+
+if njit is not None:
+
+    @njit(parallel=True, fastmath=True, cache=True)  # type: ignore
+    def _bce_forward_kernel(raw: np.ndarray, t: np.ndarray, eps: float) -> float:
+        # clip, log and row-sum fused into one parallel pass over the batch
+        n, c = raw.shape
+        total = 0.0
+        for i in prange(n):
+            row = 0.0
+            for j in range(c):
+                p = raw[i, j]
+                if p < eps:
+                    p = eps
+                elif p > 1.0 - eps:
+                    p = 1.0 - eps
+                row -= t[i, j] * np.log(p) + (1.0 - t[i, j]) * np.log1p(-p)
+            total += row
+        return total / n
+
+    @njit(parallel=True, fastmath=True, cache=True)  # type: ignore
+    def _bce_backward_kernel(
+        raw: np.ndarray,
+        t: np.ndarray,
+        eps: float,
+        grad: np.ndarray,
+    ) -> None:
+        n, c = raw.shape
+        for i in prange(n):
+            for j in range(c):
+                p = raw[i, j]
+                if p < eps:
+                    p = eps
+                elif p > 1.0 - eps:
+                    p = 1.0 - eps
+                divisor = p * (1.0 - p)
+                if divisor < eps:
+                    divisor = eps
+                grad[i, j] = (p - t[i, j]) / divisor
+
+else:
+    _bce_forward_kernel = None  # type: ignore
+    _bce_backward_kernel = None  # type: ignore
+
+# relative
+from ...adp.data_subject_list import DataSubjectList
+from ..autodp.gamma_tensor import GammaTensor
+from ..autodp.phi_tensor import PhiTensor
+from ..lazy_repeat_array import lazyrepeatarray
+
+
+class Loss:
+    """Base class for loss functions."""
+
+    def forward(
+        self, outputs: PhiTensor, targets: PhiTensor
+    ) -> Union[PhiTensor, GammaTensor]:
+        """Mean loss over the batch, as a DP tensor which can be published."""
+        raise NotImplementedError
+
+    def backward(
+        self, outputs: PhiTensor, targets: PhiTensor
+    ) -> Union[PhiTensor, GammaTensor]:
+        """Gradient of the loss w.r.t. the model outputs."""
+        raise NotImplementedError
+
+
+class BinaryCrossEntropy(Loss):
+    """Binary cross entropy between sigmoid outputs and binary targets.
+
+    Both passes are fused into single vectorized expressions over the raw
+    ``.child`` arrays, with the DP bounds reconstructed analytically from the
+    clipped output bounds. Chaining the individual PhiTensor ops instead
+    would materialize (and bound-propagate) half a dozen batch-sized
+    intermediates per call.
+
+    When numba is installed both passes run as JIT-compiled parallel loops
+    (clip, log and reduction fused in a single sweep over the batch, split
+    across threads). Failing that, numexpr's blocked VM evaluates the fused
+    expressions on L1-sized chunks, and plain NumPy is the final fallback;
+    all three paths compute the same values.
+    """
+
+    def __init__(self, epsilon: float = 1e-11) -> None:
+        self.epsilon = epsilon
+
+    def _clipped_child(self, outputs: PhiTensor) -> np.ndarray:
+        raw = outputs.child
+        eps = self.epsilon  # noqa: F841
+        hi = 1.0 - self.epsilon  # noqa: F841
+        if numexpr is not None:
+            return numexpr.evaluate("where(raw < eps, eps, where(raw > hi, hi, raw))")
+        return np.clip(raw, self.epsilon, hi)
+
+    def _clipped_bounds(
+        self, outputs: PhiTensor
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        p_lo = np.clip(outputs.min_vals.data, self.epsilon, 1 - self.epsilon)
+        p_hi = np.clip(outputs.max_vals.data, self.epsilon, 1 - self.epsilon)
+        return p_lo, p_hi
+
+    def forward(
+        self, outputs: PhiTensor, targets: PhiTensor
+    ) -> Union[PhiTensor, GammaTensor]:
+        t = targets.child
+
+        # one pass over the batch: loss = mean_b( sum_d( -t*log(p) - (1-t)*log(1-p) ) )
+        if _bce_forward_kernel is not None:
+            result = np.array(
+                _bce_forward_kernel(
+                    np.ascontiguousarray(outputs.child, dtype=np.float64),
+                    np.ascontiguousarray(t, dtype=np.float64),
+                    self.epsilon,
+                )
+            )
+        else:
+            p = self._clipped_child(outputs)
+            if numexpr is not None:
+                log_loss = numexpr.evaluate(
+                    "-(t * log(p) + (1.0 - t) * log1p(-p))"
+                )
+            else:
+                log_loss = -(t * np.log(p) + (1.0 - t) * np.log1p(-p))
+            result = np.array(log_loss.sum(axis=1).mean())
+
+        # per-element loss is non-negative and maximal at one of the four
+        # (target bound, output bound) corners; the batch mean of row sums is
+        # therefore bounded by n_outputs times the largest corner value
+        p_lo, p_hi = self._clipped_bounds(outputs)
+        t_lo = targets.min_vals.data
+        t_hi = targets.max_vals.data
+        corners = [
+            -(t_bound * np.log(p_bound) + (1.0 - t_bound) * np.log1p(-p_bound))
+            for t_bound in (t_lo, t_hi)
+            for p_bound in (p_lo, p_hi)
+        ]
+        max_val = np.max(np.maximum.reduce(corners)) * outputs.shape[1]
+
+        min_vals = lazyrepeatarray(data=np.array(0.0), shape=result.shape)
+        max_vals = lazyrepeatarray(data=np.array(max_val), shape=result.shape)
+
+        if len(outputs.data_subjects.one_hot_lookup) == 1:
+            return PhiTensor(
+                child=result,
+                data_subjects=DataSubjectList.from_objs(
+                    outputs.data_subjects.one_hot_lookup[0]
+                ),
+                min_vals=min_vals,
+                max_vals=max_vals,
+            )
+
+        return GammaTensor(
+            child=result,
+            data_subjects=outputs.data_subjects.sum(),
+            min_val=min_vals,
+            max_val=max_vals,
+        )
+
+    def backward(
+        self, outputs: PhiTensor, targets: PhiTensor
+    ) -> Union[PhiTensor, GammaTensor]:
+        t = targets.child
+
+        # fused grad = (p - t) / max(p * (1 - p), eps), one pass, no intermediates
+        if _bce_backward_kernel is not None:
+            raw = np.ascontiguousarray(outputs.child, dtype=np.float64)
+            grad = np.empty_like(raw)
+            _bce_backward_kernel(
+                raw,
+                np.ascontiguousarray(t, dtype=np.float64),
+                self.epsilon,
+                grad,
+            )
+        else:
+            p = self._clipped_child(outputs)
+            eps = self.epsilon  # noqa: F841
+            if numexpr is not None:
+                inv_divisor = numexpr.evaluate(
+                    "1.0 / where(p * (1.0 - p) > eps, p * (1.0 - p), eps)"
+                )
+                grad = numexpr.evaluate("(p - t) * inv_divisor")
+            else:
+                inv_divisor = 1.0 / np.maximum(p * (1.0 - p), self.epsilon)
+                grad = (p - t) * inv_divisor
+
+        # bounds from public metadata only, never from the private values:
+        # the divisor p*(1-p) is concave with its maximum at p=0.5, so over
+        # [p_lo, p_hi] it ranges from the smaller endpoint value up to 0.25
+        # (or the larger endpoint value when the interval excludes 0.5),
+        # kept away from zero by epsilon exactly like the gradient itself
+        p_lo, p_hi = self._clipped_bounds(outputs)
+        end_lo = p_lo * (1.0 - p_lo)
+        end_hi = p_hi * (1.0 - p_hi)
+        div_lo = np.maximum(np.minimum(end_lo, end_hi), self.epsilon)
+        div_hi = np.maximum(
+            np.where(
+                (p_lo <= 0.5) & (p_hi >= 0.5), 0.25, np.maximum(end_lo, end_hi)
+            ),
+            self.epsilon,
+        )
+
+        numerator_lo = p_lo - targets.max_vals.data
+        numerator_hi = p_hi - targets.min_vals.data
+        corners = [
+            numerator / divisor
+            for numerator in (numerator_lo, numerator_hi)
+            for divisor in (div_lo, div_hi)
+        ]
+
+        return PhiTensor(
+            child=grad,
+            data_subjects=outputs.data_subjects,
+            min_vals=lazyrepeatarray(
+                data=np.minimum.reduce(corners), shape=grad.shape
+            ),
+            max_vals=lazyrepeatarray(
+                data=np.maximum.reduce(corners), shape=grad.shape
+            ),
+        )
@@ -0,0 +1,471 @@
+# future
+from __future__ import annotations
+
+# stdlib
+from concurrent.futures import ThreadPoolExecutor
+import copy
+import queue
+import threading
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+# third party
+import numpy as np
+
+# relative
+from ..autodp.gamma_tensor import GammaTensor
+from ..autodp.phi_tensor import PhiTensor
+from .layers.base import Layer
+from .loss import Loss
+from .optimizers import Optimizer
+
+
+class Model:
+    """A sequential neural network which trains directly on private
+    PhiTensor data.
+
+    The training loop is completely local to the data owner's node; only the
+    loss (a DP tensor) can be published through the usual privacy budget
+    accounting.
+    """
+
+    def __init__(self, layers: Optional[List[Layer]] = None) -> None:
+        self.layers: List[Layer] = []
+        if layers is not None:
+            for layer in layers:
+                self.add(layer)
+
+        self.loss: Optional[Loss] = None
+        self.optimizer: Optional[Optimizer] = None
+        self._params: List[np.ndarray] = []
+
+        # persistent index permutation reused across epochs (resized in fit);
+        # shuffling this is O(N) over int64 indices instead of O(N*D) over
+        # the data itself
+        self._perm = np.arange(0, dtype=np.int64)
+
+        # model-private PCG64 generator: faster than the legacy global
+        # Mersenne Twister and immune to other code reseeding global state
+        self._rng = np.random.default_rng()
+
+    def add(self, layer: Layer) -> None:
+        if not isinstance(layer, Layer):
+            raise TypeError(f"Expected a Layer, got {type(layer)}.")
+        self.layers.append(layer)
+
+    def compile(self, loss: Loss, optimizer: Optimizer) -> None:
+        """Connect the layers and attach the loss and optimizer."""
+        for i, layer in enumerate(self.layers):
+            if i == 0:
+                layer.first_layer = True
+            layer.connect_to(self.layers[i - 1] if i > 0 else None)
+
+        self.loss = loss
+        self.optimizer = optimizer
+
+        # the parameter and gradient arrays are created in connect_to and
+        # then only ever mutated in place (see the Layer contract), so these
+        # lists can be built once instead of re-concatenated on every batch
+        self._params = [p for layer in self.layers for p in layer.params]
+        self._grads = [g for layer in self.layers for g in layer.grads]
+
+    def _compiled(self) -> Tuple[Loss, Optimizer]:
+        """The loss and optimizer, narrowed out of their ``Optional`` slots;
+        raises if ``compile`` has not been called yet."""
+        if self.loss is None or self.optimizer is None:
+            raise RuntimeError("Model must be compiled before calling fit.")
+        return self.loss, self.optimizer
+
+    def fit(
+        self,
+        X: PhiTensor,
+        Y: PhiTensor,
+        epochs: int = 10,
+        batch_size: int = 32,
+        shuffle: bool = True,
+        verbose: bool = False,
+        workers: int = 1,
+        grad_sync: bool = False,
+        micro_batch_size: Optional[int] = None,
+        device: str = "cpu",
+    ) -> List[Union[PhiTensor, GammaTensor]]:
+        """Train the model and return the per-batch training losses of the
+        final epoch as DP tensors.
+
+        When ``workers > 1`` the batches of each epoch are split across that
+        many threads which run forward/backward concurrently on the shared
+        parameter arrays (Hogwild-style); the occasional stale parameter
+        read this allows is a standard trade-off for near-linear speedup on
+        sparse-ish updates. The optimizer itself serializes its steps, so
+        each applied gradient is internally consistent.
+
+        With ``grad_sync=True`` the workers instead run synchronous data
+        parallelism: each batch is split into one shard per worker, the shard
+        gradients are summed (an in-process allreduce) and a single optimizer
+        step is taken, so every step sees the whole batch. Losses are then
+        recorded per shard.
+
+        ``micro_batch_size`` (serial path only) splits each batch into
+        microbatches whose gradients are accumulated before a single
+        optimizer step, dividing peak activation memory by the number of
+        microbatches while taking exactly the step the full batch would.
+
+        Only ``device="cpu"`` is supported: the min/max bound propagation in
+        the autodp tensors is NumPy-only, so the layer kernels cannot be
+        moved to an accelerator until that stack grows a device backend.
+        """
+        loss, optimizer = self._compiled()
+        if device != "cpu":
+            raise NotImplementedError(
+                "Training on device "
+                + f"'{device}' is not supported: PhiTensor bound tracking "
+                + "is NumPy-only, so training runs on the CPU."
+            )
+
+        train_X, train_Y = X, Y
+        n_samples = train_Y.shape[0]
+        num_batches = n_samples // batch_size
+
+        if self._perm.shape[0] != n_samples:
+            self._perm = np.arange(n_samples, dtype=np.int64)
+
+        # preallocated once and reused every epoch: slice assignment per batch
+        # instead of extending Python lists element by element
+        n_covered = num_batches * batch_size
+        epoch_preds = np.empty((n_covered, self.layers[-1].out_shape[-1]))
+        epoch_targets = np.empty((n_covered,) + tuple(train_Y.shape[1:]))
+
+        train_losses: List[Union[PhiTensor, GammaTensor]] = []
+        for epoch in range(1, epochs + 1):
+            if shuffle:
+                self._rng.shuffle(self._perm)
+
+            if workers > 1 and grad_sync:
+                train_losses = self._fit_epoch_allreduce(
+                    train_X,
+                    train_Y,
+                    batch_size,
+                    num_batches,
+                    workers,
+                    epoch_preds,
+                    epoch_targets,
+                )
+            elif workers > 1:
+                train_losses = self._fit_epoch_hogwild(
+                    train_X,
+                    train_Y,
+                    batch_size,
+                    num_batches,
+                    workers,
+                    epoch_preds,
+                    epoch_targets,
+                )
+            else:
+                train_losses = []
+                for batch_begin, x_batch, y_batch in self._prefetch_batches(
+                    train_X, train_Y, batch_size, num_batches
+                ):
+                    batch_end = batch_begin + batch_size
+
+                    if (
+                        micro_batch_size is not None
+                        and micro_batch_size < batch_size
+                    ):
+                        self._train_batch_microbatched(
+                            x_batch,
+                            y_batch,
+                            micro_batch_size,
+                            batch_begin,
+                            train_losses,
+                            epoch_preds,
+                            epoch_targets,
+                        )
+                        continue
+
+                    y_pred = self.predict(x_batch)
+                    self._backward(self.layers, y_pred, y_batch)
+                    optimizer.update(self._params, self._grads)
+
+                    train_losses.append(loss.forward(y_pred, y_batch))
+                    epoch_preds[batch_begin:batch_end] = np.asarray(y_pred.child)
+                    epoch_targets[batch_begin:batch_end] = np.asarray(y_batch.child)
+
+            if verbose:
+                train_acc = self.accuracy(epoch_preds, epoch_targets)
+                mean_loss = np.mean(
+                    [np.asarray(loss.child).mean() for loss in train_losses]
+                )
+                print(
+                    f"Epoch {epoch}/{epochs} - loss: {mean_loss:.4f} "
+                    f"- acc: {train_acc:.4f}"
+                )
+
+        return train_losses
+
+    def _backward(
+        self,
+        layers: List[Layer],
+        y_pred: Union[PhiTensor, GammaTensor],
+        y_batch: PhiTensor,
+    ) -> None:
+        """Run the whole backward pass in one call: seed the gradient from
+        the loss and push it through the layers in reverse.
+
+        The parameter gradients end up in each layer's preallocated buffers
+        (see the Layer contract), so there is nothing to return; callers read
+        the gradients through ``grads``/``self._grads``. The activation
+        gradients between layers are DP tensors built by the autodp ops, so
+        they cannot be written into a raw workspace buffer without losing
+        their bound tracking.
+        """
+        loss, _ = self._compiled()
+        next_grad = loss.backward(y_pred, y_batch)
+        for layer in reversed(layers):
+            next_grad = layer.backward(next_grad)
+
+    def _prefetch_batches(
+        self,
+        train_X: PhiTensor,
+        train_Y: PhiTensor,
+        batch_size: int,
+        num_batches: int,
+    ) -> Iterator[Tuple[int, PhiTensor, PhiTensor]]:
+        """Yield ``(batch_begin, x_batch, y_batch)`` with the next batch
+        sliced in a background thread while the caller trains on the current
+        one.
+
+        The batch gather (PhiTensor.take plus its bound bookkeeping) spends
+        most of its time in NumPy C code that releases the GIL, so a single
+        producer thread with a bounded queue overlaps it with the compute of
+        the previous batch instead of serializing the two.
+
+        If the consumer stops early (an exception in the training body, or
+        the generator being closed), the producer is told to stop and is
+        joined, so no thread or queued batches outlive the call.
+        """
+        batch_queue: queue.Queue = queue.Queue(maxsize=2)
+        stop = threading.Event()
+
+        def produce() -> None:
+            for b in range(num_batches):
+                if stop.is_set():
+                    return
+                batch_begin = b * batch_size
+                batch_idx = self._perm[batch_begin : batch_begin + batch_size]  # noqa: E203
+                item = (
+                    batch_begin,
+                    train_X.take(batch_idx, axis=0),
+                    train_Y.take(batch_idx, axis=0),
+                )
+                while not stop.is_set():
+                    try:
+                        batch_queue.put(item, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+        try:
+            for _ in range(num_batches):
+                yield batch_queue.get()
+        finally:
+            stop.set()
+            producer.join()
+
+    def _train_batch_microbatched(
+        self,
+        x_batch: PhiTensor,
+        y_batch: PhiTensor,
+        micro_batch_size: int,
+        batch_begin: int,
+        train_losses: List[Union[PhiTensor, GammaTensor]],
+        epoch_preds: np.ndarray,
+        epoch_targets: np.ndarray,
+    ) -> None:
+        """Run one batch as a sequence of microbatches.
+
+        Activations only ever exist for one microbatch at a time. Layer
+        gradients are sums over the batch rows (see the Layer contract), so
+        accumulating the microbatch gradients reproduces the full-batch
+        gradient exactly and the single optimizer step at the end is
+        identical to a full-batch step.
+        """
+        loss, optimizer = self._compiled()
+        batch_size = y_batch.shape[0]
+        num_micro = -(-batch_size // micro_batch_size)
+        micro_rows = np.array_split(np.arange(batch_size), num_micro)
+
+        accum_grads: Optional[List[np.ndarray]] = None
+        for rows in micro_rows:
+            x_micro = x_batch.take(rows, axis=0)
+            y_micro = y_batch.take(rows, axis=0)
+
+            y_pred = self.predict(x_micro)
+            self._backward(self.layers, y_pred, y_micro)
+
+            # the gradient buffers are reused across microbatches, so the
+            # first accumulation must copy them
+            if accum_grads is None:
+                accum_grads = [np.array(g, dtype=float) for g in self._grads]
+            else:
+                for acc, grad in zip(accum_grads, self._grads):
+                    acc += grad
+
+            train_losses.append(loss.forward(y_pred, y_micro))
+            epoch_preds[batch_begin + rows] = np.asarray(y_pred.child)
+            epoch_targets[batch_begin + rows] = np.asarray(y_micro.child)
+
+        if accum_grads is not None:
+            optimizer.update(self._params, accum_grads)
+
+    def _worker_layers(self) -> List[Layer]:
+        """Shallow-copy the layers so each worker has private activation and
+        gradient slots while the weight arrays themselves stay shared."""
+        replicas = []
+        for layer in self.layers:
+            clone = copy.copy(layer)
+            activation = getattr(clone, "activation", None)
+            if activation is not None:
+                setattr(clone, "activation", copy.copy(activation))
+            clone.detach_grads()
+            replicas.append(clone)
+        return replicas
+
+    def _fit_epoch_hogwild(
+        self,
+        train_X: PhiTensor,
+        train_Y: PhiTensor,
+        batch_size: int,
+        num_batches: int,
+        workers: int,
+        epoch_preds: np.ndarray,
+        epoch_targets: np.ndarray,
+    ) -> List[Union[PhiTensor, GammaTensor]]:
+        loss, optimizer = self._compiled()
+        train_losses: List = [None] * num_batches
+
+        def run_batches(batch_ids: List[int], layers: List[Layer]) -> None:
+            for b in batch_ids:
+                batch_begin = b * batch_size
+                batch_end = batch_begin + batch_size
+                batch_idx = self._perm[batch_begin:batch_end]
+                x_batch = train_X.take(batch_idx, axis=0)
+                y_batch = train_Y.take(batch_idx, axis=0)
+
+                y_pred = x_batch
+                for layer in layers:
+                    y_pred = layer.forward(y_pred)
+                self._backward(layers, y_pred, y_batch)
+
+                grads = [g for layer in layers for g in layer.grads]
+                # lock-free update written straight into the shared arrays;
+                # the replicas share the weight arrays, so the cached
+                # parameter list is valid for every worker
+                optimizer.update(self._params, grads)
+
+                train_losses[b] = loss.forward(y_pred, y_batch)
+                # disjoint slices per batch, so this is safe across threads
+                epoch_preds[batch_begin:batch_end] = np.asarray(y_pred.child)
+                epoch_targets[batch_begin:batch_end] = np.asarray(y_batch.child)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(
+                    run_batches,
+                    list(range(w, num_batches, workers)),
+                    self._worker_layers(),
+                )
+                for w in range(workers)
+            ]
+            for future in futures:
+                future.result()
+
+        return train_losses
+
+    def _fit_epoch_allreduce(
+        self,
+        train_X: PhiTensor,
+        train_Y: PhiTensor,
+        batch_size: int,
+        num_batches: int,
+        workers: int,
+        epoch_preds: np.ndarray,
+        epoch_targets: np.ndarray,
+    ) -> List[Union[PhiTensor, GammaTensor]]:
+        loss, optimizer = self._compiled()
+        train_losses: List[Union[PhiTensor, GammaTensor]] = []
+        replicas = [self._worker_layers() for _ in range(workers)]
+        shard_rows = np.array_split(np.arange(batch_size), workers)
+
+        def run_shard(
+            layers: List[Layer],
+            x_shard: PhiTensor,
+            y_shard: PhiTensor,
+        ) -> tuple:
+            y_pred = x_shard
+            for layer in layers:
+                y_pred = layer.forward(y_pred)
+            self._backward(layers, y_pred, y_shard)
+
+            grads = [g for layer in layers for g in layer.grads]
+            return y_pred, grads
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for b in range(num_batches):
+                batch_begin = b * batch_size
+                batch_idx = self._perm[batch_begin : batch_begin + batch_size]  # noqa: E203
+                x_batch = train_X.take(batch_idx, axis=0)
+                y_batch = train_Y.take(batch_idx, axis=0)
+
+                x_shards = [x_batch.take(rows, axis=0) for rows in shard_rows]
+                y_shards = [y_batch.take(rows, axis=0) for rows in shard_rows]
+                futures = [
+                    pool.submit(run_shard, replica, x_shard, y_shard)
+                    for replica, x_shard, y_shard in zip(
+                        replicas, x_shards, y_shards
+                    )
+                ]
+                results = [future.result() for future in futures]
+
+                # allreduce: every layer gradient is a sum over its rows (see
+                # the Layer contract), so summing the shard gradients yields
+                # exactly the full-batch gradient for the single step below
+                grads_total = [
+                    np.add.reduce([grads[i] for _, grads in results])
+                    for i in range(len(results[0][1]))
+                ]
+                optimizer.update(self._params, grads_total)
+
+                offset = batch_begin
+                for (y_pred, _), y_shard in zip(results, y_shards):
+                    shard_len = y_shard.shape[0]
+                    train_losses.append(loss.forward(y_pred, y_shard))
+                    epoch_preds[offset : offset + shard_len] = np.asarray(  # noqa: E203
+                        y_pred.child
+                    )
+                    epoch_targets[offset : offset + shard_len] = np.asarray(  # noqa: E203
+                        y_shard.child
+                    )
+                    offset += shard_len
+
+        return train_losses
+
+    def predict(self, X: PhiTensor) -> PhiTensor:
+        """Forward pass through all layers."""
+        x_next = X
+        for layer in self.layers:
+            x_next = layer.forward(x_next)
+        return x_next
+
+    def accuracy(self, outputs: np.ndarray, targets: np.ndarray) -> float:
+        """Fraction of samples whose predicted class matches the target.
+
+        Both arguments are the contiguous prediction/target arrays that fit
+        records per epoch, so the argmax runs directly on them without any
+        list-to-array conversion or dtype inference first.
+        """
+        return float((outputs.argmax(axis=1) == targets.argmax(axis=1)).mean())
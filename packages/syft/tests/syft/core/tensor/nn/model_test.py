@@ -0,0 +1,263 @@
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+from syft.core.adp.data_subject_list import DataSubjectList
+from syft.core.tensor.autodp.phi_tensor import PhiTensor
+from syft.core.tensor.nn import Adamax
+from syft.core.tensor.nn import BinaryCrossEntropy
+from syft.core.tensor.nn import Linear
+from syft.core.tensor.nn import Model
+from syft.core.tensor.nn.layers.reshape import Flatten
+
+
+@pytest.fixture
+def data_subjects() -> DataSubjectList:
+    return DataSubjectList.from_objs(np.array(["ishan"] * 16))
+
+
+@pytest.fixture
+def train_x(data_subjects: DataSubjectList) -> PhiTensor:
+    data = np.random.uniform(-1, 1, size=(16, 4))
+    return PhiTensor(
+        child=data,
+        data_subjects=data_subjects,
+        min_vals=np.ones_like(data) * -1,
+        max_vals=np.ones_like(data),
+    )
+
+
+@pytest.fixture
+def train_y(data_subjects: DataSubjectList) -> PhiTensor:
+    labels = np.random.randint(2, size=16)
+    data = np.eye(2)[labels]
+    return PhiTensor(
+        child=data,
+        data_subjects=data_subjects,
+        min_vals=np.zeros_like(data),
+        max_vals=np.ones_like(data),
+    )
+
+
+def test_flatten_shapes() -> None:
+    layer = Flatten(input_shape=(None, 2, 3, 4))
+    layer.connect_to()
+
+    assert layer.out_shape == (None, 24)
+
+
+def test_flatten_forward_backward(data_subjects: DataSubjectList) -> None:
+    data = np.random.uniform(size=(16, 2, 3))
+    tensor = PhiTensor(
+        child=data,
+        data_subjects=data_subjects,
+        min_vals=np.zeros_like(data),
+        max_vals=np.ones_like(data),
+    )
+    layer = Flatten(input_shape=(None, 2, 3))
+    layer.connect_to()
+
+    output = layer.forward(tensor)
+    assert output.shape == (16, 6)
+
+    grad = layer.backward(output)
+    assert grad.shape == data.shape
+    assert (grad.child == data).all()
+
+
+def test_linear_forward_shape(train_x: PhiTensor) -> None:
+    layer = Linear(n_out=2, n_in=4, activation="sigmoid")
+    layer.connect_to()
+
+    output = layer.forward(train_x)
+    assert output.shape == (16, 2)
+    assert output.child.min() >= 0
+    assert output.child.max() <= 1
+
+
+def test_bce_forward_matches_numpy(
+    data_subjects: DataSubjectList, train_y: PhiTensor
+) -> None:
+    loss = BinaryCrossEntropy()
+    data = np.random.uniform(0.1, 0.9, size=(16, 2))
+    outputs = PhiTensor(
+        child=data,
+        data_subjects=data_subjects,
+        min_vals=np.zeros_like(data),
+        max_vals=np.ones_like(data),
+    )
+
+    result = loss.forward(outputs, train_y)
+
+    p = np.clip(outputs.child, loss.epsilon, 1 - loss.epsilon)
+    t = train_y.child
+    expected = np.mean(-(t * np.log(p) + (1 - t) * np.log(1 - p)).sum(axis=1))
+    assert np.isclose(np.asarray(result.child).item(), expected)
+
+
+def test_bce_backward_bounds_are_public(
+    data_subjects: DataSubjectList, train_y: PhiTensor
+) -> None:
+    loss = BinaryCrossEntropy()
+
+    def outputs(value: float) -> PhiTensor:
+        data = np.full((16, 2), value)
+        return PhiTensor(
+            child=data,
+            data_subjects=data_subjects,
+            min_vals=np.zeros_like(data),
+            max_vals=np.ones_like(data),
+        )
+
+    grad_a = loss.backward(outputs(0.5), train_y)
+    grad_b = loss.backward(outputs(0.1), train_y)
+
+    # same public metadata must give the same bounds regardless of the
+    # private values, and the bounds must still contain the gradients
+    assert (grad_a.min_vals.data == grad_b.min_vals.data).all()
+    assert (grad_a.max_vals.data == grad_b.max_vals.data).all()
+    for grad in (grad_a, grad_b):
+        assert (grad.child >= grad.min_vals.data).all()
+        assert (grad.child <= grad.max_vals.data).all()
+
+
+def test_model_fit_runs(train_x: PhiTensor, train_y: PhiTensor) -> None:
+    model = Model()
+    model.add(Linear(n_out=2, n_in=4, activation="sigmoid"))
+    model.compile(loss=BinaryCrossEntropy(), optimizer=Adamax())
+
+    initial_weights = model.layers[0].W.copy()
+    losses = model.fit(train_x, train_y, epochs=2, batch_size=4)
+
+    assert len(losses) == 4
+    # the optimizer should actually have moved the weights
+    assert not np.allclose(model.layers[0].W, initial_weights)
+
+
+def test_model_fit_hogwild_workers(train_x: PhiTensor, train_y: PhiTensor) -> None:
+    model = Model()
+    model.add(Linear(n_out=2, n_in=4, activation="sigmoid"))
+    model.compile(loss=BinaryCrossEntropy(), optimizer=Adamax())
+
+    initial_weights = model.layers[0].W.copy()
+    losses = model.fit(train_x, train_y, epochs=2, batch_size=4, workers=2)
+
+    assert len(losses) == 4
+    assert all(loss is not None for loss in losses)
+    assert not np.allclose(model.layers[0].W, initial_weights)
+
+
+def test_model_fit_grad_sync_workers(train_x: PhiTensor, train_y: PhiTensor) -> None:
+    model = Model()
+    model.add(Linear(n_out=2, n_in=4, activation="sigmoid"))
+    model.compile(loss=BinaryCrossEntropy(), optimizer=Adamax())
+
+    initial_weights = model.layers[0].W.copy()
+    losses = model.fit(
+        train_x, train_y, epochs=2, batch_size=4, workers=2, grad_sync=True
+    )
+
+    # one loss per shard: 4 batches x 2 workers
+    assert len(losses) == 8
+    assert not np.allclose(model.layers[0].W, initial_weights)
+
+
+def test_grad_sync_matches_serial(train_x: PhiTensor, train_y: PhiTensor) -> None:
+    def build() -> Model:
+        model = Model()
+        model.add(Linear(n_out=2, n_in=4, activation="sigmoid"))
+        model.compile(loss=BinaryCrossEntropy(), optimizer=Adamax())
+        return model
+
+    serial = build()
+    synced = build()
+    synced.layers[0].W[...] = serial.layers[0].W
+    synced.layers[0].b[...] = serial.layers[0].b
+
+    serial.fit(train_x, train_y, epochs=2, batch_size=8, shuffle=False)
+    synced.fit(
+        train_x,
+        train_y,
+        epochs=2,
+        batch_size=8,
+        shuffle=False,
+        workers=2,
+        grad_sync=True,
+    )
+
+    # shard gradients sum to the full-batch gradient, so the synchronous
+    # path takes exactly the same steps as the serial one
+    assert np.allclose(serial.layers[0].W, synced.layers[0].W)
+    assert np.allclose(serial.layers[0].b, synced.layers[0].b)
+
+
+def test_linear_grad_buffers_are_stable(
+    train_x: PhiTensor, train_y: PhiTensor
+) -> None:
+    model = Model()
+    model.add(Linear(n_out=2, n_in=4, activation="sigmoid"))
+    model.compile(loss=BinaryCrossEntropy(), optimizer=Adamax())
+
+    model.fit(train_x, train_y, epochs=1, batch_size=4)
+    grad_ids = [id(g) for g in model.layers[0].grads]
+    model.fit(train_x, train_y, epochs=1, batch_size=4)
+
+    # backward writes into the buffers allocated in connect_to
+    assert [id(g) for g in model.layers[0].grads] == grad_ids
+
+
+def test_model_fit_microbatched(train_x: PhiTensor, train_y: PhiTensor) -> None:
+    model = Model()
+    model.add(Linear(n_out=2, n_in=4, activation="sigmoid"))
+    model.compile(loss=BinaryCrossEntropy(), optimizer=Adamax())
+
+    initial_weights = model.layers[0].W.copy()
+    losses = model.fit(
+        train_x, train_y, epochs=2, batch_size=4, micro_batch_size=2
+    )
+
+    # one loss per microbatch: 4 batches x 2 microbatches
+    assert len(losses) == 8
+    assert not np.allclose(model.layers[0].W, initial_weights)
+
+
+def test_microbatched_matches_full_batch(
+    train_x: PhiTensor, train_y: PhiTensor
+) -> None:
+    def build() -> Model:
+        model = Model()
+        model.add(Linear(n_out=2, n_in=4, activation="sigmoid"))
+        model.compile(loss=BinaryCrossEntropy(), optimizer=Adamax())
+        return model
+
+    full = build()
+    micro = build()
+    micro.layers[0].W[...] = full.layers[0].W
+    micro.layers[0].b[...] = full.layers[0].b
+
+    full.fit(train_x, train_y, epochs=2, batch_size=8, shuffle=False)
+    micro.fit(
+        train_x,
+        train_y,
+        epochs=2,
+        batch_size=8,
+        shuffle=False,
+        micro_batch_size=4,
+    )
+
+    # accumulated microbatch gradients equal the full-batch gradient, so
+    # the optimizer takes identical steps
+    assert np.allclose(full.layers[0].W, micro.layers[0].W)
+    assert np.allclose(full.layers[0].b, micro.layers[0].b)
+
+
+def test_model_accuracy() -> None:
+    model = Model()
+    outputs = np.array([[0.9, 0.1], [0.2, 0.8], [0.7, 0.3]])
+    targets = np.array([[1, 0], [0, 1], [1, 0]])
+
+    assert model.accuracy(outputs, targets) == 1.0
+
+    targets = np.array([[0, 1], [0, 1], [1, 0]])
+    assert np.isclose(model.accuracy(outputs, targets), 2 / 3)
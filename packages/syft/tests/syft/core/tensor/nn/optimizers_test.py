@@ -0,0 +1,60 @@
+# third party
+import numpy as np
+
+# syft absolute
+from syft.core.tensor.nn import Adamax
+
+
+def test_adamax_matches_per_param_reference() -> None:
+    np.random.seed(42)
+    params = [np.random.uniform(size=(4, 3)), np.random.uniform(size=(3,))]
+    reference = [p.copy() for p in params]
+
+    optimizer = Adamax()
+    ms = [np.zeros_like(p) for p in reference]
+    vs = [np.zeros_like(p) for p in reference]
+
+    for step in range(1, 4):
+        grads = [np.random.uniform(-1, 1, size=p.shape) for p in params]
+        optimizer.update(params, grads)
+
+        a_t = optimizer.lr / (1 - optimizer.beta1**step)
+        for i, (p, g) in enumerate(zip(reference, grads)):
+            ms[i] = g * (1 - optimizer.beta1) + ms[i] * optimizer.beta1
+            vs[i] = np.maximum(np.abs(g), vs[i] * optimizer.beta2)
+            p -= a_t * ms[i] / (vs[i] + optimizer.epsilon)
+
+    for p, ref in zip(params, reference):
+        assert np.allclose(p, ref)
+
+
+def test_adamax_state_is_float32() -> None:
+    optimizer = Adamax()
+    param = np.ones((2, 2))
+    optimizer.update([param], [np.ones((2, 2))])
+
+    assert optimizer.ms.dtype == np.float32
+    assert optimizer.vs.dtype == np.float32
+
+
+def test_lr_decay_schedule() -> None:
+    optimizer = Adamax(lr=0.1, decay=0.5)
+    param = np.ones(2)
+
+    for step in range(1, 4):
+        optimizer.update([param], [np.ones(2)])
+        assert np.isclose(optimizer.lr, 0.1 / (1 + 0.5 * step))
+
+    # the undecayed rate is kept so the schedule never compounds
+    assert optimizer.base_lr == 0.1
+
+
+def test_adamax_updates_in_place() -> None:
+    param = np.ones((2, 2))
+    param_id = id(param)
+
+    optimizer = Adamax()
+    optimizer.update([param], [np.ones((2, 2))])
+
+    assert id(param) == param_id
+    assert not np.allclose(param, np.ones((2, 2)))